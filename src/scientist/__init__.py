@@ -24,14 +24,16 @@ from .comparators import (
 from .context import (
     get_default_enabled,
     get_default_publisher,
+    get_measure_cpu,
     set_default_enabled,
     set_default_publisher,
+    set_measure_cpu,
 )
 from .errors import ExperimentMismatchError
-from .experiment import Experiment
+from .experiment import Experiment, collect_experiments, flush_experiments
 from .gates import entity_gate, group_gate, request_gate
 from .observation import Observation, async_observe, observe
-from .protocols import Comparator, Publisher
+from .protocols import BatchPublisher, Comparator, Publisher, publish_batch
 from .publishers import (
     CompositePublisher,
     LogPublisher,
@@ -50,6 +52,8 @@ __all__ = [
     "Result",
     "Comparator",
     "Publisher",
+    "BatchPublisher",
+    "publish_batch",
     "DefaultComparator",
     "CallableComparator",
     "comparator_from_func",
@@ -66,10 +70,14 @@ __all__ = [
     "ExperimentMismatchError",
     "observe",
     "async_observe",
+    "collect_experiments",
+    "flush_experiments",
     "set_default_publisher",
     "get_default_publisher",
     "set_default_enabled",
     "get_default_enabled",
+    "set_measure_cpu",
+    "get_measure_cpu",
     "entity_gate",
     "group_gate",
     "request_gate",
@@ -11,10 +11,10 @@ T = TypeVar("T")
 
 
 class DefaultComparator(Generic[T]):
-    """Compares using the == operator."""
+    """Compares using the == operator, short-circuiting on identity."""
 
     def compare(self, control: T, candidate: T) -> bool:
-        return control == candidate
+        return control is candidate or control == candidate
 
 
 class CallableComparator(Generic[T]):
@@ -1,4 +1,4 @@
-"""ContextVar-based defaults for publisher and enabled state."""
+"""ContextVar-based defaults for publisher, enabled state, and CPU timing."""
 
 from __future__ import annotations
 
@@ -14,6 +14,10 @@ _default_enabled_context: ContextVar[bool] = ContextVar(
     "scientist_default_enabled", default=True
 )
 
+_measure_cpu_context: ContextVar[bool] = ContextVar(
+    "scientist_measure_cpu", default=True
+)
+
 
 def set_default_publisher(publisher: Publisher | None) -> None:
     """Set the default publisher for all experiments."""
@@ -33,3 +37,17 @@ def set_default_enabled(enabled: bool) -> None:
 def get_default_enabled() -> bool:
     """Get default enabled state (defaults to True)."""
     return _default_enabled_context.get()
+
+
+def set_measure_cpu(enabled: bool) -> None:
+    """Set whether observations record CPU time alongside wall-clock time.
+
+    Disabling skips the process_time() calls around every behavior, which
+    is worthwhile when behaviors are I/O-bound and CPU time is noise.
+    """
+    _measure_cpu_context.set(enabled)
+
+
+def get_measure_cpu() -> bool:
+    """Get whether CPU time is measured (defaults to True)."""
+    return _measure_cpu_context.get()
@@ -6,20 +6,194 @@ results, publishes findings. Always returns the control's result.
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import random
-from collections.abc import Awaitable, Callable, Collection
-from typing import Generic, TypeVar
+import threading
+from collections.abc import Awaitable, Callable, Collection, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import replace
+from typing import Any, Generic, TypeVar
 
 from .comparators import DefaultComparator
 from .context import get_default_enabled, get_default_publisher
 from .errors import ExperimentMismatchError
 from .observation import Observation, async_observe, observe
-from .protocols import Comparator, Publisher
-from .publishers import NoopPublisher
+from .protocols import Comparator, Publisher, publish_batch
+from .publishers import (
+    CompositePublisher,
+    LogPublisher,
+    NoopPublisher,
+    OTelPublisher,
+)
 from .result import Result
 
 T = TypeVar("T")
 
+_NOOP_PUBLISHER = NoopPublisher()
+
+# Built-in publishers swallow their own errors and need no wrapping
+_SELF_GUARDED_PUBLISHERS = (
+    NoopPublisher,
+    LogPublisher,
+    OTelPublisher,
+    CompositePublisher,
+)
+
+
+class _SafePublisher:
+    """Wraps a user publisher so its errors never reach the caller."""
+
+    __slots__ = ("publisher",)
+
+    def __init__(self, publisher: Publisher) -> None:
+        self.publisher = publisher
+
+    def publish(self, result: object) -> None:
+        try:
+            self.publisher.publish(result)
+        except Exception:
+            pass
+
+    def publish_batch(self, results: Iterable[object]) -> None:
+        try:
+            publish_batch(self.publisher, results)
+        except Exception:
+            pass
+
+
+def _guarded(publisher: Publisher) -> Publisher:
+    # Exact type checks: a subclass may override publish() and raise
+    cls = type(publisher)
+    if cls is _SafePublisher or cls in _SELF_GUARDED_PUBLISHERS:
+        return publisher
+    return _SafePublisher(publisher)
+
+
+def _unguarded(publisher: Publisher) -> Publisher:
+    if type(publisher) is _SafePublisher:
+        return publisher.publisher
+    return publisher
+
+
+# (default publisher, its guarded form), so run() doesn't re-wrap each time
+_guarded_default: tuple[Publisher, Publisher] | None = None
+
+
+def _get_guarded_default(default: Publisher) -> Publisher:
+    global _guarded_default
+    cached = _guarded_default
+    if cached is not None and cached[0] is default:
+        return cached[1]
+    guarded = _guarded(default)
+    _guarded_default = (default, guarded)
+    return guarded
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Lazily create the thread pool shared by all parallel experiments."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(thread_name_prefix="scientist")
+    return _executor
+
+
+class _PendingBatch:
+    """Results queued by schedule() within one collect_experiments() scope.
+
+    Guarded by a lock because tasks and copied-context threads share the
+    same batch. Once closed, schedule() publishes immediately instead.
+    """
+
+    __slots__ = ("results", "closed", "lock")
+
+    def __init__(self) -> None:
+        self.results: list[tuple[Publisher, Result[Any]]] = []
+        self.closed = False
+        self.lock = threading.Lock()
+
+    def add(self, publisher: Publisher, result: Result[Any]) -> bool:
+        """Queue a result; returns False if the scope has already closed."""
+        with self.lock:
+            if self.closed:
+                return False
+            self.results.append((publisher, result))
+            return True
+
+    def take(self, *, close: bool = False) -> list[tuple[Publisher, Result[Any]]]:
+        """Swap out everything queued so far, optionally closing the batch."""
+        with self.lock:
+            queued, self.results = self.results, []
+            if close:
+                self.closed = True
+        return queued
+
+
+_pending_batch_context: ContextVar[_PendingBatch | None] = ContextVar(
+    "scientist_pending_batch", default=None
+)
+
+
+@contextmanager
+def collect_experiments() -> Iterator[None]:
+    """Open a batch scope for Experiment.schedule().
+
+    Results scheduled inside the block are queued and published in
+    batches when the block exits (or earlier via flush_experiments()).
+    The scope is shared by asyncio tasks created within it and by threads
+    that run under contextvars.copy_context().run; plain executor jobs do
+    not inherit it. schedule() calls after the block exits, e.g. from a
+    task that outlived it, publish immediately.
+    """
+    batch = _PendingBatch()
+    token = _pending_batch_context.set(batch)
+    try:
+        yield
+    finally:
+        try:
+            _publish_queued(batch.take(close=True))
+        finally:
+            _pending_batch_context.reset(token)
+
+
+def flush_experiments() -> int:
+    """Publish all results queued by Experiment.schedule() so far.
+
+    Results are grouped by publisher and handed to each in a single
+    publish_batch() call. Publisher errors are swallowed, as with run().
+    Returns the number of results flushed (0 outside collect_experiments()).
+    """
+    batch = _pending_batch_context.get()
+    if batch is None:
+        return 0
+    return _publish_queued(batch.take())
+
+
+def _publish_queued(queued: list[tuple[Publisher, Result[Any]]]) -> int:
+    batches: dict[int, tuple[Publisher, list[Result[Any]]]] = {}
+    for publisher, result in queued:
+        batch = batches.get(id(publisher))
+        if batch is None:
+            batches[id(publisher)] = (publisher, [result])
+        else:
+            batch[1].append(result)
+
+    for publisher, results in batches.values():
+        try:
+            publish_batch(publisher, results)
+        except Exception:
+            pass
+
+    return len(queued)
+
 
 class Experiment(Generic[T]):
     """Experiment for safe refactoring through controlled experiments.
@@ -28,15 +202,16 @@ class Experiment(Generic[T]):
     1. Check if enabled
     2. Check run_if gate
     3. Run before_run hooks
-    4. Execute control and candidate in random order
+    4. Execute control and candidate in random order (or concurrently)
     5. Compare observations
     6. Apply ignore filters
     7. Publish result
     8. Return control value
     """
 
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str, *, rng: random.Random | None = None) -> None:
         self.name = name
+        self._rng = rng
         self._control: Callable[[], T] | None = None
         self._candidate: Callable[[], T] | None = None
         self._comparator: Comparator[T] = DefaultComparator()
@@ -47,6 +222,7 @@ class Experiment(Generic[T]):
         self._before_run_hooks: list[Callable[[], None]] = []
         self._clean_fn: Callable[[], None] | None = None
         self._raise_on_mismatches = False
+        self._parallel: bool | None = None
 
     def use(self, control: Callable[[], T]) -> Experiment[T]:
         """Set the control (old) behavior."""
@@ -64,8 +240,8 @@ class Experiment(Generic[T]):
         return self
 
     def publish(self, publisher: Publisher) -> Experiment[T]:
-        """Set the publisher for results."""
-        self._publisher = publisher
+        """Set the publisher for results. Its errors are swallowed."""
+        self._publisher = _guarded(publisher)
         return self
 
     def run_if(self, fn: Callable[[], bool]) -> Experiment[T]:
@@ -127,13 +303,41 @@ class Experiment(Generic[T]):
         self._raise_on_mismatches = True
         return self
 
+    def parallel(self, value: bool = True) -> Experiment[T]:
+        """Run control and candidate concurrently instead of one after the other.
+
+        Wall-clock latency becomes max(control, candidate) rather than the
+        sum, which pays off for I/O-bound behaviors. Sync behaviors run on a
+        shared thread pool. async_run() already gathers by default.
+        """
+        self._parallel = value
+        return self
+
+    def sequential(self) -> Experiment[T]:
+        """Run control and candidate one after the other in random order.
+
+        This is the default for run(); use it to opt async_run() out of
+        running both coroutines concurrently.
+        """
+        self._parallel = False
+        return self
+
     def _is_enabled(self) -> bool:
         if self._enabled is not None:
             return self._enabled
         return get_default_enabled()
 
+    def _control_first(self) -> bool:
+        """Flip the coin that decides execution order (or pool submission)."""
+        return bool((self._rng or random).getrandbits(1))
+
     def _get_publisher(self) -> Publisher:
-        return self._publisher or get_default_publisher() or NoopPublisher()
+        if self._publisher is not None:
+            return self._publisher
+        default = get_default_publisher()
+        if default is None:
+            return _NOOP_PUBLISHER
+        return _get_guarded_default(default)
 
     def _run_control_only(self) -> T:
         if self._control is None:
@@ -153,29 +357,48 @@ class Experiment(Generic[T]):
             ignored=False,
         )
 
-        ignored = False
-        for ignore_filter in self._ignore_filters:
-            if ignore_filter(result):
-                ignored = True
-                break
-
-        if ignored:
-            result = Result(
-                experiment_name=self.name,
-                control=control_obs,
-                candidate=candidate_obs,
-                matched=matched,
-                ignored=True,
-            )
+        # Ignoring only matters for mismatches
+        if matched or not self._ignore_filters:
+            return result
+
+        if any(f(result) for f in self._ignore_filters):
+            return replace(result, ignored=True)
 
         return result
 
-    def _finish(self, result: Result[T], control_obs: Observation[T]) -> T:
+    def _observe_parallel(
+        self, control: Callable[[], T], candidate: Callable[[], T]
+    ) -> tuple[Observation[T], Observation[T]]:
+        """Observe one behavior on the shared pool and the other inline.
+
+        Each side runs in its own copy of the caller's context so
+        ContextVar-based state is visible to both behaviors.
+        """
+        pool = _get_executor()
+
+        if self._control_first():
+            future = pool.submit(
+                contextvars.copy_context().run, observe, "candidate", candidate
+            )
+            control_obs = observe("control", control)
+            candidate_obs = future.result()
+        else:
+            future = pool.submit(
+                contextvars.copy_context().run, observe, "control", control
+            )
+            candidate_obs = observe("candidate", candidate)
+            control_obs = future.result()
+
+        return control_obs, candidate_obs
+
+    def _finish(
+        self, result: Result[T], control_obs: Observation[T], *, defer: bool = False
+    ) -> T:
         publisher = self._get_publisher()
-        try:
+        batch = _pending_batch_context.get() if defer else None
+        # Queue the user's publisher so flushes batch across experiments
+        if batch is None or not batch.add(_unguarded(publisher), result):
             publisher.publish(result)
-        except Exception:
-            pass
 
         if self._raise_on_mismatches and result.unexpected_mismatch:
             raise ExperimentMismatchError(result)
@@ -187,6 +410,19 @@ class Experiment(Generic[T]):
 
     def run(self) -> T:
         """Run the experiment. Returns control value."""
+        return self._run(defer=False)
+
+    def schedule(self) -> T:
+        """Run the experiment but queue its result for a batched publish.
+
+        Inside collect_experiments() the result is published when the
+        scope exits or flush_experiments() is called; outside one it is
+        published immediately, as with run(). Returns the control value
+        like run(); raise_on_mismatches still applies immediately.
+        """
+        return self._run(defer=True)
+
+    def _run(self, *, defer: bool) -> T:
         if not self._is_enabled():
             return self._run_control_only()
 
@@ -196,21 +432,27 @@ class Experiment(Generic[T]):
         for hook in self._before_run_hooks:
             hook()
 
-        if self._control is None:
+        control = self._control
+        candidate = self._candidate
+        if control is None:
             raise ValueError("Control behavior not set")
-        if self._candidate is None:
+        if candidate is None:
             raise ValueError("Candidate behavior not set")
 
         try:
-            if random.random() < 0.5:
-                control_obs = observe("control", self._control)
-                candidate_obs = observe("candidate", self._candidate)
+            if self._parallel:
+                control_obs, candidate_obs = self._observe_parallel(
+                    control, candidate
+                )
+            elif self._control_first():
+                control_obs = observe("control", control)
+                candidate_obs = observe("candidate", candidate)
             else:
-                candidate_obs = observe("candidate", self._candidate)
-                control_obs = observe("control", self._control)
+                candidate_obs = observe("candidate", candidate)
+                control_obs = observe("control", control)
 
             result = self._build_result(control_obs, candidate_obs)
-            return self._finish(result, control_obs)
+            return self._finish(result, control_obs, defer=defer)
 
         finally:
             if self._clean_fn:
@@ -220,7 +462,11 @@ class Experiment(Generic[T]):
                     pass
 
     async def async_run(self) -> T:
-        """Async variant of run() for async control/candidate behaviors."""
+        """Async variant of run() for async control/candidate behaviors.
+
+        Control and candidate are awaited concurrently unless sequential()
+        was set.
+        """
         if not self._is_enabled():
             if self._control is None:
                 raise ValueError("Control behavior not set")
@@ -234,18 +480,26 @@ class Experiment(Generic[T]):
         for hook in self._before_run_hooks:
             hook()
 
-        if self._control is None:
+        control = self._control
+        candidate = self._candidate
+        if control is None:
             raise ValueError("Control behavior not set")
-        if self._candidate is None:
+        if candidate is None:
             raise ValueError("Candidate behavior not set")
 
         try:
-            if random.random() < 0.5:
-                control_obs = await async_observe("control", self._control)  # type: ignore
-                candidate_obs = await async_observe("candidate", self._candidate)  # type: ignore
+            if self._parallel is not False:
+                # async_observe never raises, so gather always returns both
+                control_obs, candidate_obs = await asyncio.gather(
+                    async_observe("control", control),  # type: ignore
+                    async_observe("candidate", candidate),  # type: ignore
+                )
+            elif self._control_first():
+                control_obs = await async_observe("control", control)  # type: ignore
+                candidate_obs = await async_observe("candidate", candidate)  # type: ignore
             else:
-                candidate_obs = await async_observe("candidate", self._candidate)  # type: ignore
-                control_obs = await async_observe("control", self._control)  # type: ignore
+                candidate_obs = await async_observe("candidate", candidate)  # type: ignore
+                control_obs = await async_observe("control", control)  # type: ignore
 
             result = self._build_result(control_obs, candidate_obs)
             return self._finish(result, control_obs)
@@ -261,7 +515,7 @@ class Experiment(Generic[T]):
         self, control: Observation[T], candidate: Observation[T]
     ) -> bool:
         if control.raised and candidate.raised:
-            return type(control.exception) == type(candidate.exception)
+            return control.exception.__class__ is candidate.exception.__class__
         if not control.raised and not candidate.raised:
             return self._comparator.compare(control.value, candidate.value)  # type: ignore
         return False
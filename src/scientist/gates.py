@@ -10,11 +10,28 @@ Three flavours:
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import random
 from collections.abc import Collection
 from typing import Callable
 
+# Shared results for gates whose decision is fixed at factory time
+_TRUE_GATE: Callable[[], bool] = lambda: True
+_FALSE_GATE: Callable[[], bool] = lambda: False
+
+
+@functools.lru_cache(maxsize=65536)
+def _bucket(salt: str, entity_id: str) -> int:
+    """Hash ``entity_id`` into one of 100 buckets.
+
+    Memoized because the same entity tends to hit the same experiment
+    repeatedly; ``_bucket.cache_clear()`` resets it.
+    """
+    key = f"{salt}:{entity_id}" if salt else entity_id
+    digest = hashlib.sha256(key.encode()).digest()
+    return int.from_bytes(digest[:8], "big") % 100
+
 
 def entity_gate(
     entity_id: str,
@@ -36,10 +53,7 @@ def entity_gate(
     Returns:
         A zero-argument callable suitable for ``Experiment.run_if()``.
     """
-    key = f"{salt}:{entity_id}" if salt else entity_id
-    bucket = int(hashlib.sha256(key.encode()).hexdigest(), 16) % 100
-    enabled = bucket < percent
-    return lambda: enabled
+    return _TRUE_GATE if _bucket(salt, entity_id) < percent else _FALSE_GATE
 
 
 def group_gate(
@@ -58,8 +72,8 @@ def group_gate(
     Returns:
         A zero-argument callable suitable for ``Experiment.run_if()``.
     """
-    matched = bool(set(allowed) & set(actual))
-    return lambda: matched
+    allowed_set = allowed if isinstance(allowed, (set, frozenset)) else set(allowed)
+    return _FALSE_GATE if allowed_set.isdisjoint(actual) else _TRUE_GATE
 
 
 def request_gate(*, percent: float) -> Callable[[], bool]:
@@ -75,4 +89,5 @@ def request_gate(*, percent: float) -> Callable[[], bool]:
     Returns:
         A zero-argument callable suitable for ``Experiment.run_if()``.
     """
-    return lambda: random.random() * 100 < percent
+    threshold = percent / 100.0
+    return lambda _random=random.random: _random() < threshold
@@ -7,15 +7,17 @@ exceptions, and execution timing (wall-clock and CPU).
 from __future__ import annotations
 
 import asyncio
-import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from time import perf_counter, process_time
 from typing import Generic, TypeVar
 
+from .context import get_measure_cpu
+
 T = TypeVar("T")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class Observation(Generic[T]):
     """Captures the execution result of a behavior.
 
@@ -52,7 +54,7 @@ class Observation(Generic[T]):
         the same exception type.
         """
         if self.raised and other.raised:
-            return type(self.exception) == type(other.exception)
+            return self.exception.__class__ is other.exception.__class__
         if not self.raised and not other.raised:
             return self.value == other.value
         return False
@@ -61,51 +63,50 @@ class Observation(Generic[T]):
 def observe(name: str, behavior: Callable[[], T]) -> Observation[T]:
     """Execute a behavior and capture its observation.
 
-    Measures both wall-clock time and CPU time.
+    Measures wall-clock time, and CPU time unless disabled with
+    set_measure_cpu(False) (cpu_time_seconds is then 0.0).
     """
-    start_time = time.perf_counter()
-    start_cpu = time.process_time()
+    measure_cpu = get_measure_cpu()
+    start_cpu = process_time() if measure_cpu else 0.0
+    start_time = perf_counter()
 
     try:
         value = behavior()
-        return Observation(
-            name=name,
-            value=value,
-            exception=None,
-            duration_seconds=time.perf_counter() - start_time,
-            cpu_time_seconds=time.process_time() - start_cpu,
-        )
+        exception = None
     except BaseException as e:
-        return Observation(
-            name=name,
-            value=None,
-            exception=e,
-            duration_seconds=time.perf_counter() - start_time,
-            cpu_time_seconds=time.process_time() - start_cpu,
-        )
+        value = None
+        exception = e
+
+    duration = perf_counter() - start_time
+    return Observation(
+        name=name,
+        value=value,
+        exception=exception,
+        duration_seconds=duration,
+        cpu_time_seconds=process_time() - start_cpu if measure_cpu else 0.0,
+    )
 
 
 async def async_observe(
     name: str, behavior: Callable[[], Awaitable[T]]
 ) -> Observation[T]:
     """Async variant of observe() for async code paths."""
-    start_time = time.perf_counter()
-    start_cpu = time.process_time()
+    measure_cpu = get_measure_cpu()
+    start_cpu = process_time() if measure_cpu else 0.0
+    start_time = perf_counter()
 
     try:
         value = await behavior()
-        return Observation(
-            name=name,
-            value=value,
-            exception=None,
-            duration_seconds=time.perf_counter() - start_time,
-            cpu_time_seconds=time.process_time() - start_cpu,
-        )
+        exception = None
     except BaseException as e:
-        return Observation(
-            name=name,
-            value=None,
-            exception=e,
-            duration_seconds=time.perf_counter() - start_time,
-            cpu_time_seconds=time.process_time() - start_cpu,
-        )
+        value = None
+        exception = e
+
+    duration = perf_counter() - start_time
+    return Observation(
+        name=name,
+        value=value,
+        exception=exception,
+        duration_seconds=duration,
+        cpu_time_seconds=process_time() - start_cpu if measure_cpu else 0.0,
+    )
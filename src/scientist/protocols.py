@@ -3,10 +3,12 @@
 Defines the fundamental abstractions:
 - Comparator[T]: Protocol for comparing observation values
 - Publisher: Protocol for publishing experiment results
+- BatchPublisher: Publisher that can also publish many results at once
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Protocol, TypeVar, runtime_checkable
 
 T = TypeVar("T")
@@ -31,3 +33,29 @@ class Publisher(Protocol):
     def publish(self, result: object) -> None:
         """Publish an experiment result."""
         ...
+
+
+@runtime_checkable
+class BatchPublisher(Publisher, Protocol):
+    """Publisher that amortizes per-call overhead across many results."""
+
+    def publish_batch(self, results: Iterable[object]) -> None:
+        """Publish several experiment results in one call."""
+        ...
+
+
+def publish_batch(publisher: Publisher, results: Iterable[object]) -> None:
+    """Publish results via publish_batch() if supported, else one by one.
+
+    In the one-by-one fallback a raising publish() only loses its own
+    result, matching how Experiment.run() isolates each publish.
+    """
+    batch = getattr(publisher, "publish_batch", None)
+    if batch is not None:
+        batch(results)
+        return
+    for result in results:
+        try:
+            publisher.publish(result)
+        except Exception:
+            pass
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
-from ..protocols import Publisher
+from ..protocols import Publisher, publish_batch
 
 if TYPE_CHECKING:
     from ..result import Result
@@ -20,12 +21,24 @@ class CompositePublisher:
         self.publishers = publishers
 
     def publish(self, result: Result[object]) -> None:
+        if not self.publishers:
+            return
         for publisher in self.publishers:
             try:
                 publisher.publish(result)
             except Exception:
                 pass
 
+    def publish_batch(self, results: Iterable[Result[object]]) -> None:
+        if not self.publishers:
+            return
+        results = list(results)
+        for publisher in self.publishers:
+            try:
+                publish_batch(publisher, results)
+            except Exception:
+                pass
+
 
 def new_composite_publisher(*publishers: Publisher) -> Publisher:
     return CompositePublisher(*publishers)  # type: ignore
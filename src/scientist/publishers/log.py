@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from ..protocols import Publisher
 
@@ -10,20 +10,56 @@ if TYPE_CHECKING:
     from ..result import Result
 
 
+class _LazyRepr:
+    """Defers repr() of a value until a renderer actually formats it.
+
+    Records dropped by level filtering never pay for the repr of large
+    control/candidate values. Behaves like the string repr(value) when
+    rendered: JSON, logfmt and key-value output match it exactly, while
+    ConsoleRenderer always quotes it (e.g. control_value='42', where the
+    plain string rendered unquoted as control_value=42).
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: object) -> None:
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return repr(self.obj)
+
+    def __repr__(self) -> str:
+        return repr(repr(self.obj))
+
+    def __structlog__(self) -> str:
+        return repr(self.obj)
+
+
 class LogPublisher:
     """Publisher that logs results via structlog.
 
-    Gracefully degrades to no-op if structlog is not installed.
+    Gracefully degrades to no-op if structlog is not installed. The
+    logger is looked up once, at construction. Logging errors are
+    swallowed (best-effort).
     """
 
-    def publish(self, result: Result[object]) -> None:
+    def __init__(self) -> None:
         try:
             import structlog
         except ImportError:
-            return
+            self._logger = None
+        else:
+            self._logger = structlog.get_logger("scientist")
 
-        logger = structlog.get_logger("scientist")
+    def publish(self, result: Result[object]) -> None:
+        if self._logger is None:
+            return
+        try:
+            self._log(self._logger, result)
+        except Exception:
+            pass
 
+    def _log(self, logger: Any, result: Result[object]) -> None:
         if result.matched:
             logger.info(
                 "experiment matched",
@@ -35,15 +71,15 @@ class LogPublisher:
             logger.info(
                 "experiment mismatched (ignored)",
                 experiment=result.experiment_name,
-                control_value=repr(result.control.value),
-                candidate_value=repr(result.candidate.value),
+                control_value=_LazyRepr(result.control.value),
+                candidate_value=_LazyRepr(result.candidate.value),
             )
         else:
             logger.warning(
                 "experiment mismatched",
                 experiment=result.experiment_name,
-                control_value=repr(result.control.value),
-                candidate_value=repr(result.candidate.value),
+                control_value=_LazyRepr(result.control.value),
+                candidate_value=_LazyRepr(result.candidate.value),
                 control_duration=result.control.duration_seconds,
                 candidate_duration=result.candidate.duration_seconds,
                 control_raised=result.control.raised,
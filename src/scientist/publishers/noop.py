@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from ..protocols import Publisher
@@ -16,6 +17,9 @@ class NoopPublisher:
     def publish(self, result: Result[object]) -> None:
         pass
 
+    def publish_batch(self, results: Iterable[Result[object]]) -> None:
+        pass
+
 
 def new_noop_publisher() -> Publisher:
     return NoopPublisher()  # type: ignore
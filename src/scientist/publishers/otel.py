@@ -10,6 +10,9 @@ Gracefully degrades to no-op if opentelemetry-api is not installed.
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from ..protocols import Publisher
@@ -18,11 +21,41 @@ if TYPE_CHECKING:
     from ..result import Result
 
 
+# Attribute mappings are cached per experiment and shared by every record.
+# The OTel API passes them through to the instrument without copying, so
+# they are read-only views: a downstream mutation raises instead of
+# corrupting later metrics.
+
+
+@functools.lru_cache(maxsize=256)
+def _result_attributes(
+    experiment: str, matched: bool, ignored: bool
+) -> Mapping[str, str]:
+    return MappingProxyType(
+        {
+            "experiment": experiment,
+            "matched": "true" if matched else "false",
+            "ignored": "true" if ignored else "false",
+        }
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _experiment_attributes(experiment: str) -> Mapping[str, str]:
+    return MappingProxyType({"experiment": experiment})
+
+
+@functools.lru_cache(maxsize=512)
+def _behavior_attributes(experiment: str, behavior: str) -> Mapping[str, str]:
+    return MappingProxyType({"experiment": experiment, "behavior": behavior})
+
+
 class OTelPublisher:
     """Publisher that records experiment results as OpenTelemetry metrics.
 
     Uses opentelemetry-api only (not SDK), so the user configures their
-    own exporter (OTLP to SigNoz, Prometheus, etc.).
+    own exporter (OTLP to SigNoz, Prometheus, etc.). Recording errors are
+    swallowed (best-effort).
 
     Args:
         meter_name: Name for the OTel meter (default: "scientist")
@@ -34,6 +67,7 @@ class OTelPublisher:
         self._total_counter = None
         self._mismatch_counter = None
         self._duration_histogram = None
+        self._trace = None
         self._initialized = False
 
     def _ensure_initialized(self) -> bool:
@@ -68,60 +102,113 @@ class OTelPublisher:
             unit="s",
         )
 
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            pass
+        else:
+            self._trace = trace
+
         return True
 
     def publish(self, result: Result[object]) -> None:
-        if not self._ensure_initialized():
-            return
+        try:
+            if self._ensure_initialized():
+                self._record(result)
+        except Exception:
+            pass
 
-        attributes = {
-            "experiment": result.experiment_name,
-            "matched": str(result.matched).lower(),
-            "ignored": str(result.ignored).lower(),
-        }
+    def publish_batch(self, results: Iterable[Result[object]]) -> None:
+        """Publish many results, adding each counter once per attribute set.
+
+        Mismatch span events are only recorded by publish().
+        """
+        try:
+            if self._ensure_initialized():
+                self._record_batch(results)
+        except Exception:
+            pass
 
-        self._total_counter.add(1, attributes)  # type: ignore
+    def _record(self, result: Result[object]) -> None:
+        name = result.experiment_name
+
+        self._total_counter.add(  # type: ignore
+            1, _result_attributes(name, result.matched, result.ignored)
+        )
 
         if result.unexpected_mismatch:
             self._mismatch_counter.add(  # type: ignore
-                1, {"experiment": result.experiment_name}
+                1, _experiment_attributes(name)
             )
 
         self._duration_histogram.record(  # type: ignore
             result.control.duration_seconds,
-            {
-                "experiment": result.experiment_name,
-                "behavior": "control",
-            },
+            _behavior_attributes(name, "control"),
         )
 
         self._duration_histogram.record(  # type: ignore
             result.candidate.duration_seconds,
-            {
-                "experiment": result.experiment_name,
-                "behavior": "candidate",
-            },
+            _behavior_attributes(name, "candidate"),
         )
 
-        # Record span event on mismatch if there's an active span
         if result.unexpected_mismatch:
-            try:
-                from opentelemetry import trace
-
-                span = trace.get_current_span()
-                if span.is_recording():
-                    span.add_event(
-                        "scientist.mismatch",
-                        attributes={
-                            "experiment": result.experiment_name,
-                            "control.value": repr(result.control.value),
-                            "candidate.value": repr(result.candidate.value),
-                            "control.raised": result.control.raised,
-                            "candidate.raised": result.candidate.raised,
-                        },
-                    )
-            except Exception:
-                pass
+            self._add_mismatch_event(result)
+
+    def _record_batch(self, results: Iterable[Result[object]]) -> None:
+        """Record many results, adding each counter once per attribute set.
+
+        Batched results are published after their experiments ran, so the
+        current span is not theirs and no mismatch span events are added.
+        """
+        totals: dict[tuple[str, bool, bool], int] = {}
+        mismatches: dict[str, int] = {}
+        record = self._duration_histogram.record  # type: ignore
+
+        try:
+            for result in results:
+                name = result.experiment_name
+                key = (name, result.matched, result.ignored)
+                totals[key] = totals.get(key, 0) + 1
+
+                if result.unexpected_mismatch:
+                    mismatches[name] = mismatches.get(name, 0) + 1
+
+                record(
+                    result.control.duration_seconds,
+                    _behavior_attributes(name, "control"),
+                )
+                record(
+                    result.candidate.duration_seconds,
+                    _behavior_attributes(name, "candidate"),
+                )
+        finally:
+            # Counters stay consistent with the histogram records made so far
+            for key, count in totals.items():
+                self._total_counter.add(  # type: ignore
+                    count, _result_attributes(*key)
+                )
+            for name, count in mismatches.items():
+                self._mismatch_counter.add(  # type: ignore
+                    count, _experiment_attributes(name)
+                )
+
+    def _add_mismatch_event(self, result: Result[object]) -> None:
+        """Record a span event on mismatch if there's an active span."""
+        if self._trace is None:
+            return
+
+        span = self._trace.get_current_span()
+        if span.is_recording():
+            span.add_event(
+                "scientist.mismatch",
+                attributes={
+                    "experiment": result.experiment_name,
+                    "control.value": repr(result.control.value),
+                    "candidate.value": repr(result.candidate.value),
+                    "control.raised": result.control.raised,
+                    "candidate.raised": result.candidate.raised,
+                },
+            )
 
 
 def new_otel_publisher(meter_name: str = "scientist") -> Publisher:
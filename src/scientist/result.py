@@ -10,7 +10,7 @@ from .observation import Observation
 T = TypeVar("T")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class Result(Generic[T]):
     """Aggregates control and candidate observations.
 
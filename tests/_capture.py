@@ -0,0 +1,43 @@
+"""Lightweight publisher and logger fakes for tests."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from scientist.result import Result
+
+
+class Capture:
+    """Publisher that records the last result and how many it received."""
+
+    __slots__ = ("result", "count")
+
+    def __init__(self) -> None:
+        self.result: Result[object] | None = None
+        self.count = 0
+
+    def publish(self, result: Result[object]) -> None:
+        self.result = result
+        self.count += 1
+
+
+class LogCapture:
+    """Structlog-shaped logger that records the last call per level."""
+
+    __slots__ = ("level", "last", "count")
+
+    def __init__(self) -> None:
+        self.level: str | None = None
+        self.last: tuple[str, dict[str, Any]] | None = None
+        self.count = 0
+
+    def _record(self, level: str, msg: str, kw: dict[str, Any]) -> None:
+        self.level = level
+        self.last = (msg, kw)
+        self.count += 1
+
+    def info(self, msg: str, **kw: Any) -> None:
+        self._record("info", msg, kw)
+
+    def warning(self, msg: str, **kw: Any) -> None:
+        self._record("warning", msg, kw)
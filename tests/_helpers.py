@@ -0,0 +1,43 @@
+"""Small behavior and observation factories shared by tests."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import NoReturn, TypeVar
+
+from scientist.observation import Observation
+
+T = TypeVar("T")
+
+
+def raises(
+    exc_cls: type[BaseException], msg: str = ""
+) -> Callable[[], NoReturn]:
+    """Return a zero-argument behavior that raises ``exc_cls(msg)``."""
+
+    def behavior() -> NoReturn:
+        raise exc_cls(msg)
+
+    return behavior
+
+
+def returns(value: T) -> Callable[[], T]:
+    """Return a zero-argument behavior that returns ``value``."""
+    return lambda: value
+
+
+# Shared constant behaviors, built once instead of per test.
+RET1, RET2, RET42, RET99 = returns(1), returns(2), returns(42), returns(99)
+
+
+def untimed(
+    name: str, value: T | None = None, exception: BaseException | None = None
+) -> Observation[T]:
+    """Build an Observation directly, with both timing fields 0.0."""
+    return Observation(
+        name=name,
+        value=value,
+        exception=exception,
+        duration_seconds=0.0,
+        cpu_time_seconds=0.0,
+    )
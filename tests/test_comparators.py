@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from scientist.comparators import (
     CallableComparator,
     DefaultComparator,
@@ -10,6 +12,8 @@ from scientist.comparators import (
     set_comparator,
 )
 
+pytestmark = pytest.mark.benchmark(group="comparators")
+
 
 class TestDefaultComparator:
     def test_equal(self):
@@ -22,6 +26,14 @@ class TestDefaultComparator:
         assert DefaultComparator().compare("abc", "abc")
         assert not DefaultComparator().compare("abc", "xyz")
 
+    def test_identical_object_skips_eq(self):
+        class NeverEqual:
+            def __eq__(self, other):
+                raise AssertionError("__eq__ should not be called")
+
+        value = NeverEqual()
+        assert DefaultComparator().compare(value, value)
+
 
 class TestCallableComparator:
     def test_custom_comparison(self):
@@ -38,26 +50,28 @@ class TestComparatorFromFunc:
 
 
 class TestPercentDifferenceComparator:
-    def test_within_threshold(self):
-        cmp = percent_difference_comparator(0.1)
-        assert cmp.compare(100.0, 105.0)
-
-    def test_outside_threshold(self):
-        cmp = percent_difference_comparator(0.1)
-        assert not cmp.compare(100.0, 120.0)
-
-    def test_both_zero(self):
-        cmp = percent_difference_comparator(0.1)
-        assert cmp.compare(0.0, 0.0)
-
-    def test_one_zero(self):
-        cmp = percent_difference_comparator(0.1)
-        assert not cmp.compare(0.0, 5.0)
-        assert not cmp.compare(5.0, 0.0)
-
-    def test_exact_threshold(self):
+    @pytest.mark.parametrize(
+        "control,candidate,expected",
+        [
+            (100.0, 105.0, True),
+            (100.0, 120.0, False),
+            (0.0, 0.0, True),
+            (0.0, 5.0, False),
+            (5.0, 0.0, False),
+            (100.0, 110.0, True),
+        ],
+        ids=[
+            "within",
+            "outside",
+            "both-zero",
+            "zero-control",
+            "zero-candidate",
+            "exact",
+        ],
+    )
+    def test_compare(self, benchmark, control, candidate, expected):
         cmp = percent_difference_comparator(0.1)
-        assert cmp.compare(100.0, 110.0)
+        assert benchmark(cmp.compare, control, candidate) is expected
 
 
 class TestSetComparator:
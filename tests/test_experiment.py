@@ -2,51 +2,81 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from unittest.mock import MagicMock
 
 import pytest
 
 from scientist.context import set_default_enabled, set_default_publisher
 from scientist.errors import ExperimentMismatchError
-from scientist.experiment import Experiment
+from scientist.experiment import (
+    Experiment,
+    collect_experiments,
+    flush_experiments,
+)
 from scientist.publishers import NoopPublisher
+from tests._capture import Capture
+from tests._helpers import RET42, RET99, raises, returns
+
+
+@pytest.fixture
+def default_disabled():
+    set_default_enabled(False)
+    yield
+    set_default_enabled(True)
 
 
 class TestExperimentBasics:
     def test_returns_control_value(self):
         exp = Experiment[int]("test")
-        exp.use(lambda: 42)
-        exp.try_(lambda: 42)
+        exp.use(RET42)
+        exp.try_(RET42)
         assert exp.run() == 42
 
     def test_returns_control_on_mismatch(self):
         exp = Experiment[int]("test")
-        exp.use(lambda: 42)
-        exp.try_(lambda: 99)
+        exp.use(RET42)
+        exp.try_(RET99)
         assert exp.run() == 42
 
     def test_candidate_exception_doesnt_affect_control(self):
         exp = Experiment[int]("test")
-        exp.use(lambda: 42)
-        exp.try_(lambda: (_ for _ in ()).throw(ValueError("boom")))
+        exp.use(RET42)
+        exp.try_(raises(ValueError, "boom"))
         assert exp.run() == 42
 
     def test_control_exception_is_reraised(self):
         exp = Experiment[int]("test")
-        exp.use(lambda: (_ for _ in ()).throw(RuntimeError("fail")))
-        exp.try_(lambda: 42)
+        exp.use(raises(RuntimeError, "fail"))
+        exp.try_(RET42)
         with pytest.raises(RuntimeError, match="fail"):
             exp.run()
 
+    def test_run_benchmark(self, benchmark):
+        def build_exp():
+            exp = Experiment[int]("test")
+            exp.use(RET42)
+            exp.try_(RET42)
+            return (exp,), {}
+
+        result = benchmark.pedantic(
+            Experiment.run, setup=build_exp, rounds=50, iterations=1
+        )
+        assert result == 42
+
     def test_missing_control_raises(self):
         exp = Experiment[int]("test")
-        exp.try_(lambda: 42)
+        exp.try_(RET42)
         with pytest.raises(ValueError, match="Control"):
             exp.run()
 
     def test_missing_candidate_raises(self):
         exp = Experiment[int]("test")
-        exp.use(lambda: 42)
+        exp.use(RET42)
         with pytest.raises(ValueError, match="Candidate"):
             exp.run()
 
@@ -61,7 +91,7 @@ class TestGates:
             return 99
 
         exp = Experiment[int]("test")
-        exp.use(lambda: 42)
+        exp.use(RET42)
         exp.try_(candidate)
         exp.run_if(lambda: False)
         result = exp.run()
@@ -77,7 +107,7 @@ class TestGates:
             return 42
 
         exp = Experiment[int]("test")
-        exp.use(lambda: 42)
+        exp.use(RET42)
         exp.try_(candidate)
         exp.run_if(lambda: True)
         exp.run()
@@ -92,14 +122,16 @@ class TestGates:
             return 99
 
         exp = Experiment[int]("test")
-        exp.use(lambda: 42)
+        exp.use(RET42)
         exp.try_(candidate)
         exp.enabled(False)
         result = exp.run()
         assert result == 42
         assert not candidate_called
 
-    def test_default_enabled_false(self):
+    @pytest.mark.serial
+    @pytest.mark.usefixtures("default_disabled")
+    def test_default_enabled_false(self, benchmark):
         candidate_called = False
 
         def candidate():
@@ -107,64 +139,70 @@ class TestGates:
             candidate_called = True
             return 99
 
-        set_default_enabled(False)
-        try:
+        def build_exp():
             exp = Experiment[int]("test")
-            exp.use(lambda: 42)
+            exp.use(RET42)
             exp.try_(candidate)
-            exp.run()
-            assert not candidate_called
-        finally:
-            set_default_enabled(True)
+            return (exp,), {}
+
+        benchmark.pedantic(Experiment.run, setup=build_exp, rounds=10, iterations=1)
+        assert not candidate_called
 
 
 class TestIgnoreFilters:
     def test_ignore_filter_marks_ignored(self):
-        publisher = MagicMock()
+        cap = Capture()
         exp = Experiment[int]("test")
-        exp.use(lambda: 42)
-        exp.try_(lambda: 99)
+        exp.use(RET42)
+        exp.try_(RET99)
         exp.ignore(lambda r: True)
-        exp.publish(publisher)
+        exp.publish(cap)
         exp.run()
 
-        published_result = publisher.publish.call_args[0][0]
-        assert published_result.ignored
-        assert published_result.mismatched
+        assert cap.result.ignored
+        assert cap.result.mismatched
 
     def test_no_ignore_filter_leaves_unignored(self):
-        publisher = MagicMock()
+        cap = Capture()
         exp = Experiment[int]("test")
-        exp.use(lambda: 42)
-        exp.try_(lambda: 99)
-        exp.publish(publisher)
+        exp.use(RET42)
+        exp.try_(RET99)
+        exp.publish(cap)
         exp.run()
 
-        published_result = publisher.publish.call_args[0][0]
-        assert not published_result.ignored
-        assert published_result.mismatched
+        assert not cap.result.ignored
+        assert cap.result.mismatched
+
+    def test_ignore_filter_skipped_on_match(self):
+        calls = []
+        exp = Experiment[int]("test")
+        exp.use(RET42)
+        exp.try_(RET42)
+        exp.ignore(lambda r: calls.append(r) or True)
+        exp.run()
+        assert calls == []
 
 
 class TestRaiseOnMismatches:
     def test_raises_on_mismatch(self):
         exp = Experiment[int]("test")
-        exp.use(lambda: 42)
-        exp.try_(lambda: 99)
+        exp.use(RET42)
+        exp.try_(RET99)
         exp.raise_on_mismatches()
         with pytest.raises(ExperimentMismatchError):
             exp.run()
 
     def test_no_raise_on_match(self):
         exp = Experiment[int]("test")
-        exp.use(lambda: 42)
-        exp.try_(lambda: 42)
+        exp.use(RET42)
+        exp.try_(RET42)
         exp.raise_on_mismatches()
         assert exp.run() == 42
 
     def test_no_raise_on_ignored_mismatch(self):
         exp = Experiment[int]("test")
-        exp.use(lambda: 42)
-        exp.try_(lambda: 99)
+        exp.use(RET42)
+        exp.try_(RET99)
         exp.raise_on_mismatches()
         exp.ignore(lambda r: True)
         assert exp.run() == 42
@@ -174,8 +212,8 @@ class TestHooksAndCleanup:
     def test_before_run_hooks(self):
         calls = []
         exp = Experiment[int]("test")
-        exp.use(lambda: 42)
-        exp.try_(lambda: 42)
+        exp.use(RET42)
+        exp.try_(RET42)
         exp.before_run(lambda: calls.append("hook1"))
         exp.before_run(lambda: calls.append("hook2"))
         exp.run()
@@ -184,8 +222,8 @@ class TestHooksAndCleanup:
     def test_cleanup_runs_on_success(self):
         cleaned = []
         exp = Experiment[int]("test")
-        exp.use(lambda: 42)
-        exp.try_(lambda: 42)
+        exp.use(RET42)
+        exp.try_(RET42)
         exp.clean(lambda: cleaned.append(True))
         exp.run()
         assert cleaned == [True]
@@ -193,8 +231,8 @@ class TestHooksAndCleanup:
     def test_cleanup_runs_on_error(self):
         cleaned = []
         exp = Experiment[int]("test")
-        exp.use(lambda: (_ for _ in ()).throw(RuntimeError()))
-        exp.try_(lambda: 42)
+        exp.use(raises(RuntimeError))
+        exp.try_(RET42)
         exp.clean(lambda: cleaned.append(True))
         with pytest.raises(RuntimeError):
             exp.run()
@@ -203,23 +241,24 @@ class TestHooksAndCleanup:
 
 class TestPublishing:
     def test_publishes_result(self):
-        publisher = MagicMock()
+        cap = Capture()
         exp = Experiment[int]("test")
-        exp.use(lambda: 42)
-        exp.try_(lambda: 42)
-        exp.publish(publisher)
+        exp.use(RET42)
+        exp.try_(RET42)
+        exp.publish(cap)
         exp.run()
-        publisher.publish.assert_called_once()
+        assert cap.count == 1
 
+    @pytest.mark.serial
     def test_default_publisher(self):
-        publisher = MagicMock()
-        set_default_publisher(publisher)
+        cap = Capture()
+        set_default_publisher(cap)
         try:
             exp = Experiment[int]("test")
-            exp.use(lambda: 42)
-            exp.try_(lambda: 42)
+            exp.use(RET42)
+            exp.try_(RET42)
             exp.run()
-            publisher.publish.assert_called_once()
+            assert cap.count == 1
         finally:
             set_default_publisher(None)
 
@@ -231,16 +270,189 @@ class TestPublishing:
         publisher.publish.side_effect = RuntimeError("publish failed")
 
         exp = Experiment[int]("test")
-        exp.use(lambda: 42)
-        exp.try_(lambda: 42)
+        exp.use(RET42)
+        exp.try_(RET42)
         exp.publish(publisher)
         assert exp.run() == 42  # Should not raise
 
+    @pytest.mark.serial
+    def test_default_publisher_error_doesnt_propagate(self):
+        publisher = MagicMock()
+        publisher.publish.side_effect = RuntimeError("publish failed")
+        set_default_publisher(publisher)
+        try:
+            exp = Experiment[int]("test")
+            exp.use(RET42)
+            exp.try_(RET42)
+            assert exp.run() == 42  # Should not raise
+        finally:
+            set_default_publisher(None)
+
+    def test_builtin_subclass_error_doesnt_propagate(self):
+        class RaisingNoop(NoopPublisher):
+            def publish(self, result):
+                raise RuntimeError("subclass boom")
+
+        exp = Experiment[int]("test")
+        exp.use(RET42)
+        exp.try_(RET42)
+        exp.publish(RaisingNoop())
+        assert exp.run() == 42  # Should not raise
+
+    @pytest.mark.serial
+    def test_default_publisher_wrapped_once(self):
+        publisher = MagicMock()
+        set_default_publisher(publisher)
+        try:
+            exp = Experiment[int]("test")
+            assert exp._get_publisher() is exp._get_publisher()
+        finally:
+            set_default_publisher(None)
+
+
+class TestSchedule:
+    def test_defers_publish_until_flush(self):
+        cap = Capture()
+        exp = Experiment[int]("test")
+        exp.use(RET42)
+        exp.try_(RET99)
+        exp.publish(cap)
+
+        with collect_experiments():
+            assert exp.schedule() == 42
+            assert exp.schedule() == 42
+            assert cap.count == 0
+
+            assert flush_experiments() == 2
+            assert cap.count == 2
+            assert flush_experiments() == 0
+
+    def test_scope_exit_flushes(self):
+        cap = Capture()
+        exp = Experiment[int]("test")
+        exp.use(RET42)
+        exp.try_(RET42)
+        exp.publish(cap)
+
+        with collect_experiments():
+            exp.schedule()
+            assert cap.count == 0
+        assert cap.count == 1
+
+    def test_publishes_immediately_without_scope(self):
+        cap = Capture()
+        exp = Experiment[int]("test")
+        exp.use(RET42)
+        exp.try_(RET42)
+        exp.publish(cap)
+
+        assert exp.schedule() == 42
+        assert cap.count == 1
+        assert flush_experiments() == 0
+
+    async def test_collects_from_gathered_tasks(self):
+        cap = Capture()
+
+        async def child(value):
+            exp = Experiment[int](f"child-{value}")
+            exp.use(returns(value))
+            exp.try_(returns(value))
+            exp.publish(cap)
+            return exp.schedule()
+
+        with collect_experiments():
+            assert await asyncio.gather(child(1), child(2)) == [1, 2]
+            assert cap.count == 0
+            assert flush_experiments() == 2
+        assert cap.count == 2
+
+    async def test_task_outliving_scope_publishes_immediately(self):
+        cap = Capture()
+        exp = Experiment[int]("test")
+        exp.use(RET42)
+        exp.try_(RET42)
+        exp.publish(cap)
+        release = asyncio.Event()
+
+        async def late():
+            await release.wait()
+            return exp.schedule()
+
+        with collect_experiments():
+            task = asyncio.create_task(late())
+        release.set()
+        assert await task == 42
+        assert cap.count == 1
+
+    def test_copied_context_threads_share_scope(self):
+        cap = Capture()
+        exp = Experiment[int]("test")
+        exp.use(RET42)
+        exp.try_(RET42)
+        exp.publish(cap)
+
+        with ThreadPoolExecutor(max_workers=1) as pool, collect_experiments():
+            pool.submit(copy_context().run, exp.schedule).result()
+            assert cap.count == 0
+            # Plain executor jobs don't inherit the scope
+            pool.submit(exp.schedule).result()
+            assert cap.count == 1
+        assert cap.count == 2
+
+    def test_flush_batches_per_publisher(self):
+        batches = []
+
+        class BatchCapture:
+            def publish(self, result):
+                batches.append([result])
+
+            def publish_batch(self, results):
+                batches.append(list(results))
+
+        publisher = BatchCapture()
+        with collect_experiments():
+            for name in ["a", "b", "c"]:
+                exp = Experiment[int](name)
+                exp.use(RET42)
+                exp.try_(RET42)
+                exp.publish(publisher)
+                exp.schedule()
+
+        assert len(batches) == 1
+        assert [r.experiment_name for r in batches[0]] == ["a", "b", "c"]
+
+    def test_flush_isolates_each_publish(self):
+        published = []
+
+        class FlakyPublisher:
+            def publish(self, result):
+                published.append(result)
+                if len(published) == 1:
+                    raise RuntimeError("boom")
+
+        exp = Experiment[int]("test")
+        exp.use(RET42)
+        exp.try_(RET42)
+        exp.publish(FlakyPublisher())
+
+        with collect_experiments():
+            for _ in range(3):
+                exp.schedule()
+            assert flush_experiments() == 3
+        assert len(published) == 3
+
+    def test_raise_on_mismatches_is_immediate(self):
+        exp = Experiment[int]("test")
+        exp.use(RET42)
+        exp.try_(RET99)
+        exp.raise_on_mismatches()
+        with collect_experiments():
+            with pytest.raises(ExperimentMismatchError):
+                exp.schedule()
+
 
 class TestRandomOrder:
-    @patch("scientist.experiment.random")
-    def test_control_first(self, mock_random):
-        mock_random.random.return_value = 0.1
+    def test_control_first(self):
         order = []
 
         def control():
@@ -251,15 +463,14 @@ class TestRandomOrder:
             order.append("candidate")
             return 42
 
-        exp = Experiment[int]("test")
+        # Random(0).getrandbits(1) == 1: control runs first
+        exp = Experiment[int]("test", rng=random.Random(0))
         exp.use(control)
         exp.try_(candidate)
         exp.run()
         assert order == ["control", "candidate"]
 
-    @patch("scientist.experiment.random")
-    def test_candidate_first(self, mock_random):
-        mock_random.random.return_value = 0.9
+    def test_candidate_first(self):
         order = []
 
         def control():
@@ -270,19 +481,76 @@ class TestRandomOrder:
             order.append("candidate")
             return 42
 
-        exp = Experiment[int]("test")
+        # Random(1).getrandbits(1) == 0: candidate runs first
+        exp = Experiment[int]("test", rng=random.Random(1))
         exp.use(control)
         exp.try_(candidate)
         exp.run()
         assert order == ["candidate", "control"]
 
 
+class TestParallel:
+    def test_returns_control_value(self):
+        exp = Experiment[int]("test")
+        exp.use(RET42)
+        exp.try_(RET99)
+        exp.parallel()
+        assert exp.run() == 42
+
+    def test_behaviors_run_concurrently(self):
+        # Deadlocks (and times out) unless both behaviors run at once.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def control():
+            barrier.wait()
+            return 42
+
+        def candidate():
+            barrier.wait()
+            return 42
+
+        cap = Capture()
+        exp = Experiment[int]("test")
+        exp.use(control)
+        exp.try_(candidate)
+        exp.parallel()
+        exp.publish(cap)
+        assert exp.run() == 42
+
+        assert cap.result.matched
+
+    def test_control_exception_is_reraised(self):
+        def control():
+            raise RuntimeError("fail")
+
+        exp = Experiment[int]("test")
+        exp.use(control)
+        exp.try_(RET42)
+        exp.parallel()
+        with pytest.raises(RuntimeError, match="fail"):
+            exp.run()
+
+    def test_context_visible_to_both_behaviors(self):
+        var: ContextVar[str] = ContextVar("request_id", default="unset")
+        var.set("req-1")
+
+        exp = Experiment[str]("test")
+        exp.use(var.get)
+        exp.try_(var.get)
+        exp.parallel()
+        exp.raise_on_mismatches()
+        assert exp.run() == "req-1"
+
+    def test_returns_self_for_chaining(self):
+        exp = Experiment[int]("test")
+        assert exp.parallel() is exp
+
+
 class TestAsyncRun:
-    @pytest.mark.asyncio
     async def test_async_returns_control(self):
         exp = Experiment[int]("test")
-        exp.use(lambda: 42)  # type: ignore
-        exp.try_(lambda: 42)  # type: ignore
+        exp.use(RET42)  # type: ignore
+        exp.try_(RET42)  # type: ignore
 
         # For async_run, behaviors should be async
         async def control():
@@ -297,7 +565,6 @@ class TestAsyncRun:
         result = await exp2.async_run()
         assert result == 42
 
-    @pytest.mark.asyncio
     async def test_async_mismatch(self):
         async def control():
             return 42
@@ -305,18 +572,16 @@ class TestAsyncRun:
         async def candidate():
             return 99
 
-        publisher = MagicMock()
+        cap = Capture()
         exp = Experiment[int]("test")
         exp.use(control)  # type: ignore
         exp.try_(candidate)  # type: ignore
-        exp.publish(publisher)
+        exp.publish(cap)
         result = await exp.async_run()
         assert result == 42
 
-        published_result = publisher.publish.call_args[0][0]
-        assert published_result.mismatched
+        assert cap.result.mismatched
 
-    @pytest.mark.asyncio
     async def test_async_disabled_skips(self):
         called = False
 
@@ -335,3 +600,45 @@ class TestAsyncRun:
         result = await exp.async_run()
         assert result == 42
         assert not called
+
+    async def test_async_runs_concurrently_by_default(self):
+        control_started = asyncio.Event()
+        candidate_started = asyncio.Event()
+
+        async def control():
+            control_started.set()
+            await asyncio.wait_for(candidate_started.wait(), timeout=5)
+            return 42
+
+        async def candidate():
+            candidate_started.set()
+            await asyncio.wait_for(control_started.wait(), timeout=5)
+            return 42
+
+        exp = Experiment[int]("test")
+        exp.use(control)  # type: ignore
+        exp.try_(candidate)  # type: ignore
+        exp.raise_on_mismatches()
+        assert await exp.async_run() == 42
+
+    async def test_async_sequential(self):
+        running = []
+        overlapped = False
+
+        def behavior(name):
+            async def run():
+                nonlocal overlapped
+                running.append(name)
+                overlapped = overlapped or len(running) > 1
+                await asyncio.sleep(0)
+                running.remove(name)
+                return 42
+
+            return run
+
+        exp = Experiment[int]("test")
+        exp.use(behavior("control"))  # type: ignore
+        exp.try_(behavior("candidate"))  # type: ignore
+        exp.sequential()
+        assert await exp.async_run() == 42
+        assert not overlapped
@@ -2,50 +2,55 @@
 
 from __future__ import annotations
 
+import pytest
+
 from scientist import Experiment
+from tests._capture import Capture
+from tests._helpers import RET1, RET2, RET42, RET99
 
 
 class TestRunIfEntity:
     def test_deterministic_gating(self):
         """Same entity always gets same result for same experiment."""
-        results = []
+        decisions = set()
         for _ in range(10):
+            cap = Capture()
             exp = Experiment[int]("pricing-v2")
-            exp.use(lambda: 42)
-            exp.try_(lambda: 99)
+            exp.use(RET42)
+            exp.try_(RET99)
             exp.run_if_entity("customer-abc", percent=50)
-
-            publisher_results = []
-
-            class Capture:
-                def publish(self, result):
-                    publisher_results.append(result)
-
-            exp.publish(Capture())
+            exp.publish(cap)
             exp.run()
-            results.append(len(publisher_results) > 0)
+            decisions.add(cap.count)
 
         # All runs should have the same gating decision
-        assert len(set(results)) == 1
+        assert len(decisions) == 1
+
+    def test_run_benchmark(self, benchmark):
+        def build_exp():
+            exp = Experiment[int]("pricing-v2")
+            exp.use(RET42)
+            exp.try_(RET99)
+            exp.run_if_entity("customer-abc", percent=50)
+            return (exp,), {}
+
+        result = benchmark.pedantic(
+            Experiment.run, setup=build_exp, rounds=10, iterations=1
+        )
+        assert result == 42
 
     def test_uses_experiment_name_as_salt(self):
         """Different experiment names can bucket the same entity differently."""
         decisions = {}
         for name in [f"exp-{i}" for i in range(50)]:
-            ran_candidate = False
-
-            class Tracker:
-                def publish(self, result):
-                    nonlocal ran_candidate
-                    ran_candidate = True
-
+            cap = Capture()
             exp = Experiment[int](name)
-            exp.use(lambda: 42)
-            exp.try_(lambda: 99)
+            exp.use(RET42)
+            exp.try_(RET99)
             exp.run_if_entity("user-123", percent=50)
-            exp.publish(Tracker())
+            exp.publish(cap)
             exp.run()
-            decisions[name] = ran_candidate
+            decisions[name] = cap.count > 0
 
         # At 50%, not all experiments should gate the same way
         values = list(decisions.values())
@@ -59,38 +64,26 @@ class TestRunIfEntity:
 
 class TestRunIfGroup:
     def test_enabled_when_in_group(self):
-        ran_candidate = False
-
-        class Tracker:
-            def publish(self, result):
-                nonlocal ran_candidate
-                ran_candidate = True
-
+        cap = Capture()
         exp = Experiment[int]("dashboard-v2")
-        exp.use(lambda: 1)
-        exp.try_(lambda: 2)
+        exp.use(RET1)
+        exp.try_(RET2)
         exp.run_if_group(allowed={"beta"}, actual={"beta", "premium"})
-        exp.publish(Tracker())
+        exp.publish(cap)
         exp.run()
 
-        assert ran_candidate
+        assert cap.count == 1
 
     def test_disabled_when_not_in_group(self):
-        ran_candidate = False
-
-        class Tracker:
-            def publish(self, result):
-                nonlocal ran_candidate
-                ran_candidate = True
-
+        cap = Capture()
         exp = Experiment[int]("dashboard-v2")
-        exp.use(lambda: 1)
-        exp.try_(lambda: 2)
+        exp.use(RET1)
+        exp.try_(RET2)
         exp.run_if_group(allowed={"internal"}, actual={"premium"})
-        exp.publish(Tracker())
+        exp.publish(cap)
         exp.run()
 
-        assert not ran_candidate
+        assert cap.count == 0
 
     def test_returns_self_for_chaining(self):
         exp = Experiment[int]("test")
@@ -99,41 +92,29 @@ class TestRunIfGroup:
 
 
 class TestRunIfPercent:
-    def test_zero_never_runs(self):
-        ran_count = 0
-
-        class Counter:
-            def publish(self, result):
-                nonlocal ran_count
-                ran_count += 1
-
-        for _ in range(50):
-            exp = Experiment[int]("test")
-            exp.use(lambda: 1)
-            exp.try_(lambda: 2)
-            exp.run_if_percent(0)
-            exp.publish(Counter())
-            exp.run()
-
-        assert ran_count == 0
-
-    def test_hundred_always_runs(self):
-        ran_count = 0
-
-        class Counter:
-            def publish(self, result):
-                nonlocal ran_count
-                ran_count += 1
+    @pytest.mark.parametrize("percent,expected", [(0, 0), (100, 1)])
+    def test_endpoint(self, percent, expected):
+        """0% and 100% are deterministic, so one run is enough."""
+        cap = Capture()
+        exp = Experiment[int]("test")
+        exp.use(RET1)
+        exp.try_(RET2)
+        exp.run_if_percent(percent)
+        exp.publish(cap)
+        exp.run()
+        assert cap.count == expected
 
-        for _ in range(50):
-            exp = Experiment[int]("test")
-            exp.use(lambda: 1)
-            exp.try_(lambda: 2)
-            exp.run_if_percent(100)
-            exp.publish(Counter())
+    def test_fifty_runs_about_half(self):
+        cap = Capture()
+        exp = Experiment[int]("test")
+        exp.use(RET1)
+        exp.try_(RET2)
+        exp.run_if_percent(50)
+        exp.publish(cap)
+        for _ in range(1000):
             exp.run()
-
-        assert ran_count == 50
+        # ~5 standard deviations of Binomial(1000, 0.5)
+        assert abs(cap.count - 500) <= 80
 
     def test_returns_self_for_chaining(self):
         exp = Experiment[int]("test")
@@ -2,15 +2,54 @@
 
 from __future__ import annotations
 
-from scientist.gates import entity_gate, group_gate, request_gate
+import pytest
+
+from scientist.gates import _bucket, entity_gate, group_gate, request_gate
+
+pytestmark = [
+    pytest.mark.benchmark(
+        group="gates",
+        disable_gc=True,
+        warmup=True,
+        warmup_iterations=1000,
+        min_rounds=20,
+    )
+]
+
+# The distribution benchmarks time a whole 1k/10k-call batch per round, so
+# per-call warmup would only multiply their cost. Benchmarks of
+# entity_gate use pedantic() to clear the _bucket memo before each round.
+_BATCH_BENCHMARK = pytest.mark.benchmark(
+    group="gates", disable_gc=True, warmup=False, min_rounds=5
+)
 
 
 class TestEntityGate:
-    def test_deterministic_same_result(self):
+    @pytest.mark.parametrize(
+        "entity_id,percent,salt,expected",
+        [
+            ("anyone", 0, "test", False),
+            ("anyone", 100, "test", True),
+            ("customer-123", 50, "exp-a", None),
+            ("customer-123", 50, "", None),
+        ],
+        ids=["zero-percent", "hundred-percent", "salted", "no-salt"],
+    )
+    def test_decision(self, benchmark, entity_id, percent, salt, expected):
         """Same entity_id + salt always produces the same result."""
-        gate = entity_gate("customer-123", percent=50, salt="exp-a")
-        results = [gate() for _ in range(100)]
-        assert len(set(results)) == 1  # always the same
+        # Clear the bucket memo each round so the SHA-256 path is timed
+        gate = benchmark.pedantic(
+            entity_gate,
+            args=(entity_id,),
+            kwargs={"percent": percent, "salt": salt},
+            setup=_bucket.cache_clear,
+            rounds=20,
+            warmup_rounds=5,
+        )
+        results = {gate() for _ in range(100)}
+        assert len(results) == 1  # always the same
+        if expected is not None:
+            assert results == {expected}
 
     def test_deterministic_across_instances(self):
         """Two gates with same params produce the same result."""
@@ -18,6 +57,12 @@ class TestEntityGate:
         b = entity_gate("customer-123", percent=50, salt="exp-a")
         assert a() == b()
 
+    def test_reuses_shared_gate(self):
+        """Fixed decisions share a gate instead of allocating a closure."""
+        a = entity_gate("customer-123", percent=50, salt="exp-a")
+        b = entity_gate("customer-123", percent=50, salt="exp-a")
+        assert a is b
+
     def test_different_salt_different_bucket(self):
         """Different salts can produce different results for same entity."""
         # With enough entities, different salts should bucket differently
@@ -32,27 +77,30 @@ class TestEntityGate:
         # Not all entities should be bucketed the same across experiments
         assert results_a != results_b
 
-    def test_zero_percent_always_false(self):
-        gate = entity_gate("anyone", percent=0, salt="test")
-        assert gate() is False
+    @_BATCH_BENCHMARK
+    @pytest.mark.parametrize("percent", [0, 30, 50, 100])
+    def test_distribution_roughly_correct(self, benchmark, percent):
+        """With many entities at N%, roughly N% should be enabled."""
+        entity_ids = [f"user-{i}" for i in range(1000)]
 
-    def test_hundred_percent_always_true(self):
-        gate = entity_gate("anyone", percent=100, salt="test")
-        assert gate() is True
+        def count_enabled():
+            return sum(
+                entity_gate(eid, percent=percent, salt="dist-test")()
+                for eid in entity_ids
+            )
 
-    def test_distribution_roughly_correct(self):
-        """With many entities at 30%, roughly 30% should be enabled."""
-        enabled = sum(
-            entity_gate(f"user-{i}", percent=30, salt="dist-test")()
-            for i in range(1000)
+        enabled = benchmark.pedantic(
+            count_enabled, setup=_bucket.cache_clear, rounds=5
         )
         # Allow ±5% tolerance
-        assert 250 <= enabled <= 350
+        assert abs(enabled - percent * 10) <= 50
 
-    def test_no_salt_still_deterministic(self):
-        gate = entity_gate("customer-123", percent=50)
-        results = [gate() for _ in range(50)]
-        assert len(set(results)) == 1
+    def test_bucket_is_memoized(self):
+        _bucket.cache_clear()
+        first = entity_gate("customer-123", percent=50, salt="exp-a")()
+        second = entity_gate("customer-123", percent=50, salt="exp-a")()
+        assert first == second
+        assert _bucket.cache_info().hits == 1
 
 
 class TestGroupGate:
@@ -89,6 +137,18 @@ class TestGroupGate:
         results = [gate() for _ in range(50)]
         assert all(results)
 
+    @pytest.mark.parametrize(
+        "allowed,actual,expected",
+        [
+            ({"beta"}, {"beta", "premium"}, True),
+            ({"internal"}, {"beta", "premium"}, False),
+            (["beta", "internal"], ["internal"], True),
+        ],
+    )
+    def test_factory_benchmark(self, benchmark, allowed, actual, expected):
+        gate = benchmark(group_gate, allowed=allowed, actual=actual)
+        assert gate() is expected
+
 
 class TestRequestGate:
     def test_zero_percent_always_false(self):
@@ -101,11 +161,14 @@ class TestRequestGate:
         results = [gate() for _ in range(100)]
         assert all(results)
 
-    def test_distribution_roughly_correct(self):
-        """With many calls at 30%, roughly 30% should return True."""
-        gate = request_gate(percent=30)
-        enabled = sum(gate() for _ in range(10000))
-        assert 2500 <= enabled <= 3500
+    @_BATCH_BENCHMARK
+    @pytest.mark.parametrize("percent", [0, 30, 50, 100])
+    def test_distribution_roughly_correct(self, benchmark, percent):
+        """With many calls at N%, roughly N% should return True."""
+        gate = request_gate(percent=percent)
+        enabled = benchmark(lambda: sum(gate() for _ in range(10000)))
+        # Allow ±5% tolerance
+        assert abs(enabled - percent * 100) <= 500
 
     def test_non_deterministic(self):
         """Different calls can produce different results."""
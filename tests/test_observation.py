@@ -3,10 +3,33 @@
 from __future__ import annotations
 
 import asyncio
+import weakref
 
 import pytest
 
+from scientist.context import set_measure_cpu
 from scientist.observation import Observation, async_observe, observe
+from tests._helpers import raises, untimed
+
+
+@pytest.fixture(scope="module")
+def obs_42() -> Observation[int]:
+    return untimed("a", 42)
+
+
+@pytest.fixture(scope="module")
+def obs_99() -> Observation[int]:
+    return untimed("b", 99)
+
+
+@pytest.fixture(scope="module")
+def obs_valueerror() -> Observation[int]:
+    return untimed("a", exception=ValueError("x"))
+
+
+@pytest.fixture(scope="module")
+def obs_typeerror() -> Observation[int]:
+    return untimed("b", exception=TypeError())
 
 
 class TestObserve:
@@ -16,65 +39,57 @@ class TestObserve:
         assert obs.value == 42
         assert obs.exception is None
         assert not obs.raised
-        assert obs.duration_seconds >= 0
-        assert obs.cpu_time_seconds >= 0
+        assert min(obs.duration_seconds, obs.cpu_time_seconds) >= 0
 
     def test_exception_observation(self):
-        obs = observe("test", lambda: (_ for _ in ()).throw(ValueError("boom")))
+        obs = observe("test", raises(ValueError, "boom"))
         assert obs.raised
         assert isinstance(obs.exception, ValueError)
         assert obs.value is None
-        assert obs.duration_seconds >= 0
 
     def test_value_or_raise_success(self):
-        obs = observe("test", lambda: 42)
+        obs = untimed("test", 42)
         assert obs.value_or_raise == 42
 
     def test_value_or_raise_exception(self):
-        def fail():
-            raise RuntimeError("fail")
-
-        obs = observe("test", fail)
+        obs = untimed("test", exception=RuntimeError("fail"))
         with pytest.raises(RuntimeError, match="fail"):
             obs.value_or_raise
 
+    def test_supports_weakref(self, obs_42):
+        assert weakref.ref(obs_42)() is obs_42
 
-class TestEquivalentTo:
-    def test_same_values(self):
-        a = observe("a", lambda: 42)
-        b = observe("b", lambda: 42)
-        assert a.equivalent_to(b)
-
-    def test_different_values(self):
-        a = observe("a", lambda: 42)
-        b = observe("b", lambda: 99)
-        assert not a.equivalent_to(b)
+    @pytest.mark.serial
+    def test_cpu_time_skipped_when_disabled(self):
+        set_measure_cpu(False)
+        try:
+            obs = observe("test", lambda: sum(range(10000)))
+            assert obs.cpu_time_seconds == 0.0
+            assert obs.duration_seconds > 0
+        finally:
+            set_measure_cpu(True)
 
-    def test_same_exception_type(self):
-        def raise_value_error():
-            raise ValueError("x")
 
-        a = observe("a", raise_value_error)
-        b = observe("b", raise_value_error)
-        assert a.equivalent_to(b)
+class TestEquivalentTo:
+    def test_same_values(self, obs_42):
+        assert obs_42.equivalent_to(Observation("b", 42, None, 0.0, 0.0))
 
-    def test_different_exception_types(self):
-        a = observe("a", lambda: (_ for _ in ()).throw(ValueError()))
-        b = observe("b", lambda: (_ for _ in ()).throw(TypeError()))
-        assert not a.equivalent_to(b)
+    def test_different_values(self, obs_42, obs_99):
+        assert not obs_42.equivalent_to(obs_99)
 
-    def test_one_raised_one_didnt(self):
-        a = observe("a", lambda: 42)
+    def test_same_exception_type(self, obs_valueerror):
+        other = Observation("b", None, ValueError("y"), 0.0, 0.0)
+        assert obs_valueerror.equivalent_to(other)
 
-        def fail():
-            raise ValueError()
+    def test_different_exception_types(self, obs_valueerror, obs_typeerror):
+        assert not obs_valueerror.equivalent_to(obs_typeerror)
 
-        b = observe("b", fail)
-        assert not a.equivalent_to(b)
+    def test_one_raised_one_didnt(self, obs_42, obs_valueerror):
+        assert not obs_42.equivalent_to(obs_valueerror)
+        assert not obs_valueerror.equivalent_to(obs_42)
 
 
 class TestAsyncObserve:
-    @pytest.mark.asyncio
     async def test_successful_async_observation(self):
         async def compute():
             return 42
@@ -83,7 +98,6 @@ class TestAsyncObserve:
         assert obs.value == 42
         assert not obs.raised
 
-    @pytest.mark.asyncio
     async def test_exception_async_observation(self):
         async def fail():
             raise ValueError("async boom")
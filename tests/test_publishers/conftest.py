@@ -0,0 +1,45 @@
+"""Shared result fixtures for publisher tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from scientist.result import Result
+from tests._helpers import untimed
+
+
+def _make_result(*, matched: bool, ignored: bool) -> Result[int]:
+    control = untimed("control", 42)
+    candidate = untimed("candidate", 42 if matched else 99)
+    return Result(
+        experiment_name="test",
+        control=control,
+        candidate=candidate,
+        matched=matched,
+        ignored=ignored,
+    )
+
+
+@pytest.fixture(scope="module")
+def matched_result() -> Result[int]:
+    return _make_result(matched=True, ignored=False)
+
+
+@pytest.fixture(scope="module")
+def mismatched_result() -> Result[int]:
+    return _make_result(matched=False, ignored=False)
+
+
+@pytest.fixture(scope="module")
+def ignored_mismatch_result() -> Result[int]:
+    return _make_result(matched=False, ignored=True)
+
+
+@pytest.fixture(
+    scope="module",
+    params=[(True, False), (False, False), (False, True)],
+    ids=["matched", "mismatched", "ignored-mismatch"],
+)
+def result(request: pytest.FixtureRequest) -> Result[int]:
+    matched, ignored = request.param
+    return _make_result(matched=matched, ignored=ignored)
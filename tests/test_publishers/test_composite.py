@@ -4,46 +4,52 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock
 
-from scientist.observation import observe
 from scientist.publishers.composite import CompositePublisher
 from scientist.result import Result
+from tests._capture import Capture
 
 
-def _make_result() -> Result[int]:
-    control = observe("control", lambda: 42)
-    candidate = observe("candidate", lambda: 42)
-    return Result(
-        experiment_name="test",
-        control=control,
-        candidate=candidate,
-        matched=True,
-        ignored=False,
-    )
+class _Boom(Capture):
+    """Capture that records the result and then raises."""
+
+    __slots__ = ()
+
+    def publish(self, result: Result[object]) -> None:
+        super().publish(result)
+        raise RuntimeError("broken")
 
 
 class TestCompositePublisher:
-    def test_publishes_to_all(self):
-        p1 = MagicMock()
-        p2 = MagicMock()
-        p3 = MagicMock()
+    def test_publishes_to_all(self, result):
+        p1, p2, p3 = Capture(), Capture(), Capture()
 
         composite = CompositePublisher(p1, p2, p3)
-        result = _make_result()
         composite.publish(result)
 
-        p1.publish.assert_called_once_with(result)
-        p2.publish.assert_called_once_with(result)
-        p3.publish.assert_called_once_with(result)
+        for p in (p1, p2, p3):
+            assert p.count == 1 and p.result is result
 
-    def test_one_error_doesnt_stop_others(self):
-        p1 = MagicMock()
-        p2 = MagicMock()
-        p2.publish.side_effect = RuntimeError("broken")
-        p3 = MagicMock()
+    def test_one_error_doesnt_stop_others(self, result):
+        p1, p2, p3 = Capture(), _Boom(), Capture()
 
         composite = CompositePublisher(p1, p2, p3)
-        composite.publish(_make_result())
+        composite.publish(result)
+
+        assert (p1.count, p2.count, p3.count) == (1, 1, 1)
+        assert p3.result is result
+
+    def test_empty_composite_does_nothing(self, matched_result):
+        CompositePublisher().publish(matched_result)  # Should not raise
+
+    def test_publish_batch_forwards_to_all(
+        self, matched_result, mismatched_result
+    ):
+        """Spec'd mocks document which publishers get a batch call."""
+        batching = MagicMock(spec=["publish", "publish_batch"])
+        plain = MagicMock(spec=["publish"])
+        results = [matched_result, mismatched_result]
+
+        CompositePublisher(batching, plain).publish_batch(iter(results))
 
-        p1.publish.assert_called_once()
-        p2.publish.assert_called_once()
-        p3.publish.assert_called_once()
+        batching.publish_batch.assert_called_once_with(results)
+        assert plain.publish.call_count == 2
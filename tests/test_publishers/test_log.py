@@ -2,53 +2,137 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import io
+import logging
+from typing import Any
+from unittest.mock import patch
 
+import pytest
 import structlog
 
-from scientist.observation import observe
 from scientist.publishers.log import LogPublisher
 from scientist.result import Result
+from tests._capture import LogCapture
+from tests._helpers import untimed
 
 
-def _make_result(*, matched: bool = True, ignored: bool = False) -> Result[int]:
-    control = observe("control", lambda: 42)
-    candidate = observe("candidate", lambda: 42 if matched else 99)
+class _BrokenLog(LogCapture):
+    """LogCapture that records the call and then raises."""
+
+    __slots__ = ()
+
+    def _record(self, level: str, msg: str, kw: dict[str, Any]) -> None:
+        super()._record(level, msg, kw)
+        raise RuntimeError("broken")
+
+
+class _CountingRepr:
+    calls = 0
+
+    def __repr__(self):
+        type(self).calls += 1
+        return "<value>"
+
+
+def _mismatch_of(control: object, candidate: object) -> Result[object]:
     return Result(
         experiment_name="test",
-        control=control,
-        candidate=candidate,
-        matched=matched,
-        ignored=ignored,
+        control=untimed("control", control),
+        candidate=untimed("candidate", candidate),
+        matched=False,
+        ignored=False,
     )
 
 
+def _render(monkeypatch, renderer, level=logging.DEBUG) -> io.StringIO:
+    """Route LogPublisher through a real structlog pipeline into a buffer."""
+    out = io.StringIO()
+    logger = structlog.wrap_logger(
+        structlog.PrintLogger(out),
+        processors=[renderer],
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+    )
+    monkeypatch.setattr(structlog, "get_logger", lambda *args, **kwargs: logger)
+    return out
+
+
+@pytest.fixture
+def log_cap(monkeypatch):
+    cap = LogCapture()
+    monkeypatch.setattr(structlog, "get_logger", lambda *args, **kwargs: cap)
+    return cap
+
+
+@pytest.fixture
+def log_publisher(log_cap):
+    return LogPublisher()
+
+
 class TestLogPublisher:
-    def test_logs_matched(self):
-        mock_logger = MagicMock()
-        with patch.object(structlog, "get_logger", return_value=mock_logger):
-            publisher = LogPublisher()
-            publisher.publish(_make_result(matched=True))
-            mock_logger.info.assert_called_once()
-            assert "matched" in mock_logger.info.call_args[0][0]
+    def test_logs_matched(self, log_publisher, log_cap, matched_result):
+        log_publisher.publish(matched_result)
+        assert (log_cap.level, log_cap.count) == ("info", 1)
+        assert "matched" in log_cap.last[0]
 
-    def test_logs_mismatch_warning(self):
-        mock_logger = MagicMock()
-        with patch.object(structlog, "get_logger", return_value=mock_logger):
-            publisher = LogPublisher()
-            publisher.publish(_make_result(matched=False))
-            mock_logger.warning.assert_called_once()
+    def test_logs_mismatch_warning(self, log_publisher, log_cap, mismatched_result):
+        log_publisher.publish(mismatched_result)
+        assert (log_cap.level, log_cap.count) == ("warning", 1)
+        kwargs = log_cap.last[1]
+        assert str(kwargs["control_value"]) == "42"
+        assert str(kwargs["candidate_value"]) == "99"
 
-    def test_logs_ignored_mismatch_info(self):
-        mock_logger = MagicMock()
-        with patch.object(structlog, "get_logger", return_value=mock_logger):
-            publisher = LogPublisher()
-            publisher.publish(_make_result(matched=False, ignored=True))
-            mock_logger.info.assert_called_once()
-            assert "ignored" in mock_logger.info.call_args[0][0]
+    def test_logs_ignored_mismatch_info(
+        self, log_publisher, log_cap, ignored_mismatch_result
+    ):
+        log_publisher.publish(ignored_mismatch_result)
+        assert (log_cap.level, log_cap.count) == ("info", 1)
+        assert "ignored" in log_cap.last[0]
 
-    def test_graceful_without_structlog(self):
-        """Should not raise if structlog import fails."""
+    def test_logging_error_is_swallowed(self, monkeypatch, result):
+        logger = _BrokenLog()
+        monkeypatch.setattr(structlog, "get_logger", lambda *args, **kwargs: logger)
+        LogPublisher().publish(result)  # Should not raise
+        assert logger.count == 1
+
+    def test_logger_looked_up_once(self, monkeypatch, matched_result):
+        names = []
+
+        def get_logger(name):
+            names.append(name)
+            return LogCapture()
+
+        monkeypatch.setattr(structlog, "get_logger", get_logger)
         publisher = LogPublisher()
+        publisher.publish(matched_result)
+        publisher.publish(matched_result)
+        assert names == ["scientist"]
+
+    def test_graceful_without_structlog(self, mismatched_result):
+        """Should not raise if structlog import fails."""
         with patch.dict("sys.modules", {"structlog": None}):
-            publisher.publish(_make_result())  # Should not raise
+            publisher = LogPublisher()
+        publisher.publish(mismatched_result)  # Should not raise
+
+
+class TestLogRendering:
+    def test_filtered_record_skips_repr(self, monkeypatch):
+        _render(monkeypatch, structlog.processors.JSONRenderer(), logging.ERROR)
+        _CountingRepr.calls = 0
+        LogPublisher().publish(_mismatch_of(_CountingRepr(), _CountingRepr()))
+        assert _CountingRepr.calls == 0
+
+    def test_json_output(self, monkeypatch):
+        out = _render(
+            monkeypatch, structlog.processors.JSONRenderer(sort_keys=True)
+        )
+        LogPublisher().publish(_mismatch_of("abc", 42))
+        line = out.getvalue()
+        assert '"control_value": "\'abc\'"' in line
+        assert '"candidate_value": "42"' in line
+
+    def test_console_output(self, monkeypatch):
+        out = _render(monkeypatch, structlog.dev.ConsoleRenderer(colors=False))
+        LogPublisher().publish(_mismatch_of("abc", 42))
+        line = out.getvalue()
+        assert "control_value=\"'abc'\"" in line
+        assert "candidate_value='42'" in line
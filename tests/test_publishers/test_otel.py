@@ -2,75 +2,142 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from unittest.mock import MagicMock, NonCallableMock
+
+import pytest
 
-from scientist.observation import observe
 from scientist.publishers.otel import OTelPublisher
-from scientist.result import Result
 
 
-def _make_result(*, matched: bool = True, ignored: bool = False) -> Result[int]:
-    control = observe("control", lambda: 42)
-    candidate = observe("candidate", lambda: 42 if matched else 99)
-    return Result(
-        experiment_name="test",
-        control=control,
-        candidate=candidate,
-        matched=matched,
-        ignored=ignored,
-    )
+@contextmanager
+def _block_otel() -> Iterator[None]:
+    """Make opentelemetry imports fail, restoring only the touched keys."""
+    names = ("opentelemetry", "opentelemetry.metrics")
+    saved = {name: sys.modules.get(name) for name in names}
+    for name in names:
+        sys.modules[name] = None  # type: ignore[assignment]
+    try:
+        yield
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
 
 
-def _make_publisher_with_mocks():
-    """Create an OTelPublisher with pre-injected mock instruments."""
-    publisher = OTelPublisher()
+# publish() only checks that a meter is set, never calls it.
+_SENTINEL_METER = object()
+
+# Total counter, mismatch counter, histogram; spec-limited to the one
+# method the publisher calls. Built once and reset between tests.
+_INSTRUMENTS = (
+    NonCallableMock(spec=["add"]),
+    NonCallableMock(spec=["add"]),
+    NonCallableMock(spec=["record"]),
+)
+
+# One publisher reused by every mock-instrument test.
+_PUB = OTelPublisher()
 
-    mock_counter = MagicMock()
-    mock_mismatch_counter = MagicMock()
-    mock_histogram = MagicMock()
 
-    publisher._initialized = True
-    publisher._meter = MagicMock()
-    publisher._total_counter = mock_counter
-    publisher._mismatch_counter = mock_mismatch_counter
-    publisher._duration_histogram = mock_histogram
+@pytest.fixture(autouse=True)
+def _reset_pub():
+    for instrument in _INSTRUMENTS:
+        instrument.reset_mock(side_effect=True)
+    _PUB._trace = None
+    yield
+
+
+def _make_publisher_with_mocks():
+    """Inject the shared mock instruments into the shared OTelPublisher."""
+    mock_counter, mock_mismatch_counter, mock_histogram = _INSTRUMENTS
+
+    _PUB._initialized = True
+    _PUB._meter = _SENTINEL_METER
+    _PUB._total_counter = mock_counter
+    _PUB._mismatch_counter = mock_mismatch_counter
+    _PUB._duration_histogram = mock_histogram
 
-    return publisher, mock_counter, mock_mismatch_counter, mock_histogram
+    return _PUB, mock_counter, mock_mismatch_counter, mock_histogram
 
 
 class TestOTelPublisher:
-    def test_records_total_counter_on_match(self):
+    def test_records(self, result):
         publisher, counter, mismatch, histogram = _make_publisher_with_mocks()
-        publisher.publish(_make_result(matched=True))
+        publisher.publish(result)
 
         counter.add.assert_called_once()
-        args = counter.add.call_args
-        assert args[0][0] == 1
-        assert args[0][1]["matched"] == "true"
-        mismatch.add.assert_not_called()
+        amount, attributes = counter.add.call_args[0]
+        assert amount == 1
+        assert attributes["matched"] == str(result.matched).lower()
+
+        if result.unexpected_mismatch:
+            mismatch.add.assert_called_once()
+            assert mismatch.add.call_args[0][1]["experiment"] == "test"
+        else:
+            mismatch.add.assert_not_called()
+
+        calls = histogram.record.call_args_list
+        assert [c[0][1]["behavior"] for c in calls] == ["control", "candidate"]
+
+    def test_attributes_reused_across_publishes(self, matched_result):
+        publisher, counter, mismatch, histogram = _make_publisher_with_mocks()
+        publisher.publish(matched_result)
+        publisher.publish(matched_result)
+
+        first, second = counter.add.call_args_list
+        assert first[0][1] is second[0][1]
+        assert first[0][1]["ignored"] == "false"
+        with pytest.raises(TypeError):
+            first[0][1]["ignored"] = "true"
+
+    def test_mismatch_adds_span_event(self, mismatched_result):
+        publisher, counter, mismatch, histogram = _make_publisher_with_mocks()
+        publisher._trace = MagicMock()
+        span = publisher._trace.get_current_span.return_value
+        span.is_recording.return_value = True
+        publisher.publish(mismatched_result)
 
-    def test_records_mismatch_counter(self):
+        span.add_event.assert_called_once()
+        assert span.add_event.call_args[0][0] == "scientist.mismatch"
+
+    def test_publish_batch_groups_counter_adds(
+        self, matched_result, mismatched_result
+    ):
         publisher, counter, mismatch, histogram = _make_publisher_with_mocks()
-        publisher.publish(_make_result(matched=False))
+        publisher.publish_batch(
+            [matched_result, matched_result, mismatched_result]
+        )
 
+        assert counter.add.call_count == 2
+        assert counter.add.call_args_list[0][0][0] == 2
         mismatch.add.assert_called_once()
-        assert mismatch.add.call_args[0][1]["experiment"] == "test"
+        assert mismatch.add.call_args[0][0] == 1
+        assert histogram.record.call_count == 6
 
-    def test_records_duration_histogram(self):
+    def test_publish_batch_adds_no_span_events(self, mismatched_result):
         publisher, counter, mismatch, histogram = _make_publisher_with_mocks()
-        publisher.publish(_make_result())
+        publisher._trace = MagicMock()
+        publisher.publish_batch([mismatched_result])
 
-        assert histogram.record.call_count == 2
-        calls = histogram.record.call_args_list
-        assert calls[0][0][1]["behavior"] == "control"
-        assert calls[1][0][1]["behavior"] == "candidate"
+        mismatch.add.assert_called_once()
+        publisher._trace.get_current_span.assert_not_called()
 
-    def test_ignored_mismatch_not_counted_as_unexpected(self):
+    def test_publish_batch_adds_counters_despite_record_error(
+        self, matched_result, mismatched_result
+    ):
         publisher, counter, mismatch, histogram = _make_publisher_with_mocks()
-        publisher.publish(_make_result(matched=False, ignored=True))
+        histogram.record.side_effect = [None, None, RuntimeError("broken")]
+        publisher.publish_batch([matched_result, mismatched_result])
 
-        counter.add.assert_called_once()
-        mismatch.add.assert_not_called()
+        # Both results were counted before the second one's record raised
+        counter.add.assert_called()
+        assert sum(c[0][0] for c in counter.add.call_args_list) == 2
+        mismatch.add.assert_called_once()
 
     def test_lazy_initialization(self):
         """Instruments are created on first publish, not __init__."""
@@ -78,16 +145,18 @@ class TestOTelPublisher:
         assert not publisher._initialized
         assert publisher._meter is None
 
-    def test_graceful_without_otel(self):
+    def test_custom_meter_name(self):
+        """Verifies meter_name is stored correctly."""
+        publisher = OTelPublisher(meter_name="my-experiments")
+        assert publisher._meter_name == "my-experiments"
+
+
+class TestOTelFallback:
+    def test_graceful_without_otel(self, matched_result):
         """Should not raise if opentelemetry not installed."""
         publisher = OTelPublisher()
         publisher._initialized = False
 
-        with patch.dict("sys.modules", {"opentelemetry": None, "opentelemetry.metrics": None}):
+        with _block_otel():
             publisher._initialized = False
-            publisher.publish(_make_result())  # Should not raise
-
-    def test_custom_meter_name(self):
-        """Verifies meter_name is stored correctly."""
-        publisher = OTelPublisher(meter_name="my-experiments")
-        assert publisher._meter_name == "my-experiments"
+            publisher.publish(matched_result)  # Should not raise
@@ -2,46 +2,50 @@
 
 from __future__ import annotations
 
-from scientist.observation import observe
+import weakref
+
+import pytest
+
 from scientist.result import Result
+from tests._helpers import untimed
+
+
+# Result's flags come only from matched/ignored, never the observations.
+_OBS = untimed("x", 0)
 
 
 def _make_result(
     *, matched: bool = True, ignored: bool = False
 ) -> Result[int]:
-    control = observe("control", lambda: 1)
-    candidate = observe("candidate", lambda: 1 if matched else 2)
     return Result(
         experiment_name="test",
-        control=control,
-        candidate=candidate,
+        control=_OBS,
+        candidate=_OBS,
         matched=matched,
         ignored=ignored,
     )
 
 
 class TestResult:
-    def test_matched(self):
-        r = _make_result(matched=True)
-        assert r.matched
-        assert not r.mismatched
-        assert not r.unexpected_mismatch
-        assert not r.ignored_mismatch
-
-    def test_mismatched(self):
-        r = _make_result(matched=False)
-        assert r.mismatched
-        assert r.unexpected_mismatch
-        assert not r.ignored_mismatch
-
-    def test_ignored_mismatch(self):
-        r = _make_result(matched=False, ignored=True)
-        assert r.mismatched
-        assert r.ignored_mismatch
-        assert not r.unexpected_mismatch
-
-    def test_matched_ignored_is_not_mismatch(self):
-        r = _make_result(matched=True, ignored=True)
-        assert not r.mismatched
-        assert not r.unexpected_mismatch
-        assert not r.ignored_mismatch
+    @pytest.mark.parametrize(
+        "matched,ignored,mismatched,unexpected,ignored_mismatch",
+        [
+            (True, False, False, False, False),
+            (False, False, True, True, False),
+            (False, True, True, False, True),
+            (True, True, False, False, False),
+        ],
+        ids=["matched", "mismatched", "ignored-mismatch", "matched-ignored"],
+    )
+    def test_flags(
+        self, matched, ignored, mismatched, unexpected, ignored_mismatch
+    ):
+        r = _make_result(matched=matched, ignored=ignored)
+        assert r.matched is matched
+        assert r.mismatched is mismatched
+        assert r.unexpected_mismatch is unexpected
+        assert r.ignored_mismatch is ignored_mismatch
+
+    def test_supports_weakref(self):
+        r = _make_result()
+        assert weakref.ref(r)() is r